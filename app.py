@@ -6,27 +6,18 @@ Application principale SRT Translator and Video Processor avec support multi-thr
 """
 
 import tkinter as tk
-from tkinter import messagebox, filedialog, ttk
+from tkinter import messagebox, filedialog, ttk, font as tkfont
 import os
+import sys
 import logging
-from PIL import Image, ImageTk
-import webbrowser
 import threading
-import queue
+from collections import deque
 
 # Importer les modules personnalisés
-from utils import setup_logger, config, command_queue, open_file, clear_log_file
-from ui_components import ProgressWindow, ResultDialog
-from video_processor import VideoProcessor, ThreadedVideoProcessor
-
-# Configuration des logs - Regroupé et simplifié
-for logger_name in ["huggingface_hub", "huggingface_hub.file_download", 
-                   "huggingface_hub.utils", "transformers", "numba",
-                   "httpx", "openai", "urllib3", "requests"]:
-    logging.getLogger(logger_name).setLevel(logging.WARNING)
-
-# Configuration globale des logs
-logging.basicConfig(level=logging.INFO, format='[%(levelname)s] %(message)s')
+# Les modules lourds (PIL, ui_components, video_processor -> torch/whisper)
+# sont importés à la première utilisation pour accélérer le démarrage
+from utils import setup_logger, config, command_queue, open_file, clear_log_file, MAX_LOG_LINES
+
 logger = logging.getLogger(__name__)
 
 # Définition des couleurs
@@ -37,6 +28,137 @@ COLORS = {
     "error": "#f44336", "border": "#e0e0e0"
 }
 
+# Polices nommées, enregistrées une seule fois auprès de Tk et référencées par nom
+FONTS = {
+    "AppBody": {"size": 10},
+    "AppSub": {"size": 12},
+    "AppAction": {"size": 12, "weight": "bold"},
+    "AppSection": {"size": 14, "weight": "bold"},
+    "AppHeader": {"size": 16, "weight": "bold"},
+    "AppDialogTitle": {"size": 18, "weight": "bold"},
+    "AppTitle": {"size": 22, "weight": "bold"},
+    "AppNote": {"size": 9, "slant": "italic"},
+    "AppLink": {"size": 9, "underline": 1},
+    "AppMono": {"family": "Consolas", "size": 9},
+}
+
+# Champs de saisie déclaratifs : (libellé, attribut, classe du widget, options)
+_ENTRY_OPTIONS = {"bd": 1, "relief": "solid", "show": "•"}
+API_KEY_FIELDS = (
+    ("Clé API DeepL:", "deepl_key_entry", tk.Entry, _ENTRY_OPTIONS),
+    ("Clé API OpenAI:", "openai_key_entry", tk.Entry, _ENTRY_OPTIONS),
+)
+LANGUAGE_FIELDS = (
+    ("Langue cible:", "language_combobox", ttk.Combobox, {"state": "readonly", "values": [
+        "FR - French", "EN - English", "ES - Spanish", "DE - German", "IT - Italian",
+        "ZH - Chinese", "JA - Japanese", "RU - Russian", "NL - Dutch",
+        "PT - Portuguese", "AR - Arabic", "HI - Hindi", "KO - Korean", "TR - Turkish"
+    ]}),
+    ("Service de traduction:", "service_combobox", ttk.Combobox, {"state": "readonly", "values": [
+        "ChatGPT", "DeepL"
+    ]}),
+)
+WHISPER_FIELDS = (
+    ("Sélectionnez le modèle Whisper:", "whisper_model_combobox", ttk.Combobox, {"state": "readonly", "values": [
+        "tiny", "base", "small", "medium", "large", "large-v3-turbo"
+    ]}),
+)
+
+# Dimensions des fenêtres secondaires (largeur, hauteur)
+ABOUT_WINDOW_SIZE = (500, 400)
+HELP_WINDOW_SIZE = (600, 500)
+
+# Liens externes de la fenêtre d'aide : (libellé, URL)
+HELP_LINKS = (
+    ("Documentation en ligne", "https://huggingface.co/docs"),
+    ("API DeepL", "https://www.deepl.com/docs-api"),
+)
+
+# Contenu des onglets de la fenêtre d'aide : (titre, texte)
+HELP_TAB_CONTENTS = (
+    ("Démarrage rapide", """Comment utiliser SRT Translator Pro:
+
+1. Entrez une URL de vidéo dans le champ ou sélectionnez un fichier local avec le bouton "Parcourir".
+
+2. Configurez les clés API pour DeepL et/ou OpenAI selon le service de traduction que vous souhaitez utiliser.
+
+3. Sélectionnez la langue cible et le service de traduction.
+
+4. Ajustez les paramètres avancés si nécessaire (modèle Whisper, utilisation du GPU, etc.).
+
+5. Cliquez sur "Démarrer le traitement".
+
+6. Suivez la progression dans la fenêtre qui apparaît. Vous pouvez annuler à tout moment si nécessaire."""),
+    ("Paramètres avancés", """Paramètres avancés:
+
+• Modèles Whisper:
+  - tiny: Rapide, moins précis, idéal pour les tests (faibles ressources)
+  - base: Bon équilibre vitesse/précision pour les contenus simples
+  - small: Précision améliorée, adapté à la plupart des contenus
+  - medium: Haute précision, recommandé pour les contenus complexes
+  - large: Précision maximale, idéal pour les contenus difficiles
+  - large-v3-turbo: Dernière version, plus rapide et plus précise
+
+• Utilisation GPU:
+  L'option GPU accélère considérablement le traitement mais nécessite une carte NVIDIA compatible CUDA. La quantité de VRAM nécessaire dépend du modèle Whisper choisi.
+
+• Multi-threading:
+  Permet de traiter plusieurs tâches simultanément, ce qui accélère le processus global. Désactivez cette option si vous rencontrez des problèmes de stabilité ou de ressources."""),
+    ("Dépannage", """Résolution des problèmes courants:
+
+• Erreur d'API: 
+  Vérifiez que vos clés API sont correctes et que vous avez suffisamment de crédits.
+
+• Erreur de téléchargement:
+  Assurez-vous que l'URL est valide et accessible. Certaines plateformes peuvent restreindre les téléchargements.
+
+• Erreur de mémoire:
+  Essayez un modèle Whisper plus petit ou désactivez le multi-threading.
+
+• Erreur GPU:
+  Si vous rencontrez des problèmes avec le GPU, désactivez-le et utilisez le CPU.
+
+• Traduction incomplète:
+  Pour les vidéos longues, certains services peuvent limiter la taille des entrées. Essayez de diviser le traitement en sections plus petites.
+
+Pour plus d'aide, consultez les journaux d'application dans le menu "Journaux" > "Ouvrir le fichier journal"."""),
+)
+
+def _report_fatal_error(error):
+    """Journalise une erreur fatale (appelé dans un bloc except) et la signale à l'utilisateur."""
+    logging.exception("Erreur critique")
+    messagebox.showerror("Erreur critique", f"Une erreur inattendue s'est produite: {error}")
+
+def _open_link_event(event):
+    """Ouvre dans le navigateur l'URL portée par le label cliqué."""
+    import webbrowser
+    webbrowser.open_new_tab(event.widget.url)
+
+def _excepthook(exc_type, exc, tb):
+    """Journalise une exception non interceptée (thread principal, threads, callbacks Tk)."""
+    logging.critical("Erreur critique", exc_info=(exc_type, exc, tb))
+
+def _thread_excepthook(args):
+    """Transmet les exceptions des threads de traitement à _excepthook."""
+    if args.exc_type is not SystemExit:
+        _excepthook(args.exc_type, args.exc_value, args.exc_traceback)
+
+# Logos redimensionnés, partagés entre les fenêtres (indexés par taille)
+_LOGO_CACHE = {}
+
+def _get_logo(size):
+    """Retourne le logo à la taille demandée, ou None s'il est introuvable."""
+    if size not in _LOGO_CACHE:
+        try:
+            from PIL import Image, ImageTk
+            with Image.open("assets/logo.png") as logo_img:
+                resized = logo_img.convert("RGBA").resize(size, Image.LANCZOS)
+            _LOGO_CACHE[size] = ImageTk.PhotoImage(resized)
+        except Exception as e:
+            logging.debug(f"Logo indisponible: {e}")
+            _LOGO_CACHE[size] = None
+    return _LOGO_CACHE[size]
+
 class ModernButton(tk.Button):
     """Bouton modernisé avec effets de survol"""
     def __init__(self, master=None, **kwargs):
@@ -46,7 +168,7 @@ class ModernButton(tk.Button):
             'bg': self.bg_color, 'activebackground': self.hover_color,
             'bd': kwargs.get('bd', 0), 'relief': kwargs.get('relief', 'flat'),
             'fg': kwargs.get('fg', 'white'), 'activeforeground': kwargs.get('activeforeground', 'white'),
-            'font': kwargs.get('font', ('Segoe UI', 10))
+            'font': kwargs.get('font', "AppBody")
         })
         super().__init__(master, **kwargs)
         self.bind("<Enter>", self._on_enter)
@@ -73,56 +195,107 @@ class SRTTranslatorApp:
     def __init__(self):
         """Initialise l'interface utilisateur de l'application."""
         self.root = tk.Tk()
+        # Les exceptions des callbacks Tk (dont la construction incrémentale) vont au logger
+        self.root.report_callback_exception = _excepthook
         self.root.title("SRT Translator Pro")
         self.root.geometry("950x750")
         self.root.configure(bg=COLORS["background"])
         self.root.minsize(950, 850)
         
         # Configuration de la police par défaut et du thème
-        self.default_font = ('Segoe UI', 10)
         self._setup_theme()
+        self.default_font = "AppBody"
         
         # IMPORTANT: Initialize use_threading before _create_ui is called
         self.use_threading = tk.BooleanVar(value=True)
         
-        # Création de l'interface et configuration du processeur
+        # Fenêtres secondaires construites à la première ouverture puis réutilisées
+        self._about_window = None
+        self._help_window = None
+        
+        # Processeur du traitement en cours (peut différer de self.processor
+        # si l'option multi-thread est modifiée pendant le traitement)
+        self._active_processor = None
+        # Processeur et bouton d'action disponibles une fois le chargement terminé
+        self.processor = None
+        self.process_btn = None
+        
+        # Création de l'interface (incrémentale) et configuration du processeur
         self._create_ui()
-        self._update_processor()
-        self._setup_command_listener()
 
     def _setup_theme(self):
         """Configure le thème de l'application."""
+        # Polices nommées (les références évitent leur suppression côté Tk)
+        self.fonts = {
+            name: tkfont.Font(self.root, name=name, **{"family": "Segoe UI", **spec})
+            for name, spec in FONTS.items()
+        }
+        
         style = ttk.Style(self.root)
         style.theme_use("clam")
         
         # Configure les styles personnalisés
         for widget, bg in [("TFrame", COLORS["background"]), ("Card.TFrame", COLORS["card_bg"]), 
                          ("TLabel", COLORS["card_bg"]), ("TCheckbutton", COLORS["card_bg"])]:
-            style.configure(widget, background=bg, font=self.default_font)
+            style.configure(widget, background=bg, font="AppBody")
         
-        style.configure("Header.TLabel", font=("Segoe UI", 16, "bold"))
-        style.configure("Subheader.TLabel", font=("Segoe UI", 12))
-        style.configure("TEntry", font=self.default_font)
-        style.configure("TCombobox", font=self.default_font)
+        style.configure("Header.TLabel", font="AppHeader")
+        style.configure("Subheader.TLabel", font="AppSub")
+        style.configure("TEntry", font="AppBody")
+        style.configure("TCombobox", font="AppBody")
 
     def _update_processor(self):
         """Met à jour le processeur en fonction de l'option de threading."""
-        self.processor = ThreadedVideoProcessor(config) if self.use_threading.get() else VideoProcessor(config)
-        logging.info(f"Mode multi-thread {'activé' if self.use_threading.get() else 'désactivé'}")
-        self.processor.update_api_client()
+        # L'import de video_processor (torch/whisper) et la création du processeur
+        # se font hors du thread Tk ; le résultat revient par la queue de commandes
+        threading.Thread(
+            target=self._load_processor, args=(self.use_threading.get(),), daemon=True
+        ).start()
 
-    def _create_label(self, parent, text, font=None, bg=None, fg=None, anchor="w", pady=0):
-        """Crée un label avec les paramètres spécifiés."""
-        return tk.Label(
-            parent, text=text, 
-            font=font or self.default_font, 
-            bg=bg or COLORS["card_bg"],
-            fg=fg or COLORS["text"],
-            anchor=anchor
-        ).pack(anchor=anchor, pady=pady)
+    def _load_processor(self, threaded):
+        """Crée le processeur (thread d'arrière-plan)."""
+        try:
+            from video_processor import VideoProcessor, ThreadedVideoProcessor
+            processor = ThreadedVideoProcessor(config) if threaded else VideoProcessor(config)
+        except Exception as e:
+            logging.error(f"Erreur lors de la création du processeur: {e}", exc_info=True)
+            command_queue.put({"command": "processor_error", "message": str(e)})
+            return
+        command_queue.put({"command": "processor_ready", "processor": processor, "threaded": threaded})
+
+    def _set_processor(self, processor, threaded):
+        """Installe le processeur créé en arrière-plan (thread Tk)."""
+        # Ignorer un processeur devenu obsolète si l'option a changé entre-temps
+        if threaded != self.use_threading.get():
+            return
+        self.processor = processor
+        logging.info(f"Mode multi-thread {'activé' if threaded else 'désactivé'}")
+        if self.process_btn is not None:
+            self.process_btn.config(state="normal")
+        self._warmup_model()
+
+    def _warmup_model(self):
+        """Précharge en arrière-plan le modèle Whisper sélectionné."""
+        # Pendant un traitement, le modèle est emprunté : ne pas en charger une copie
+        if self.processor is None or self._active_processor is not None:
+            return
+        threading.Thread(
+            target=self.processor.warmup,
+            args=(self.whisper_model_combobox.get() or config.whisper_model,),
+            daemon=True
+        ).start()
+
+    def _build_fields(self, parent, specs):
+        """Crée les paires libellé + champ décrites par specs et les attache à l'instance."""
+        last = len(specs) - 1
+        for i, (label, name, widget_class, options) in enumerate(specs):
+            tk.Label(parent, text=label, bg=COLORS["card_bg"], font=self.default_font).pack(anchor="w")
+            widget = widget_class(parent, font=self.default_font, **options)
+            widget.pack(fill="x", pady=(5, 10) if i < last else 5)
+            setattr(self, name, widget)
 
     def _create_ui(self):
-        """Crée l'interface utilisateur principale."""
+        """Crée l'en-tête immédiatement puis planifie la construction des sections."""
         # Conteneur principal avec padding
         main_container = tk.Frame(self.root, bg=COLORS["background"], padx=20, pady=20)
         main_container.pack(fill="both", expand=True)
@@ -141,21 +314,38 @@ class SRTTranslatorApp:
         right_column = tk.Frame(content_frame, bg=COLORS["background"])
         right_column.pack(side="right", fill="both", expand=True, padx=(10, 0))
         
-        # Créer les différentes sections
-        self._create_source_section(left_column)
-        self._create_config_section(left_column)
-        self._create_advanced_section(right_column)
-        self._create_status_section(right_column)
-        
-        # Bouton d'action
-        self._create_action_button(main_container)
-        
-        # Menu et valeurs par défaut
-        self._create_menu()
-        self._load_defaults()
-        
-        # Message initial
-        logging.info("Application SRT Translator Pro démarrée et prête à l'emploi")
+        # Sections construites une par une pendant les temps morts de Tk
+        self._build_steps = [
+            lambda: self._create_source_section(left_column),
+            lambda: self._create_config_section(left_column),
+            lambda: self._create_advanced_section(right_column),
+            lambda: self._create_status_section(right_column),
+            # Après la section d'état : le TextHandler affiche ces lignes
+            self._log_startup_env,
+            self._load_defaults,
+            # Le listener doit exister pour recevoir le processeur chargé en arrière-plan
+            self._setup_command_listener,
+            self._update_processor,
+            lambda: self._create_action_button(main_container),
+            self._create_menu,
+            self._prebuild_help_window,
+        ]
+        self.root.after_idle(self._next_step)
+    
+    def _next_step(self):
+        """Exécute une étape de construction et planifie la suivante."""
+        try:
+            self._build_steps.pop(0)()
+        except Exception as e:
+            # Ne pas laisser une fenêtre à moitié construite
+            _report_fatal_error(e)
+            self.root.destroy()
+            return
+        if self._build_steps:
+            self.root.after_idle(self._next_step)
+        else:
+            # Message initial
+            logging.info("Application SRT Translator Pro démarrée et prête à l'emploi")
 
     def _create_header(self, parent):
         """Crée la section d'en-tête avec logo et titre."""
@@ -163,13 +353,11 @@ class SRTTranslatorApp:
         header_frame.pack(fill="x", pady=(0, 20))
         
         # Logo et titre
-        try:
-            logo_img = Image.open("assets/logo.png").resize((48, 48))
-            logo_photo = ImageTk.PhotoImage(logo_img)
+        logo_photo = _get_logo((48, 48))
+        if logo_photo:
             logo_label = tk.Label(header_frame, image=logo_photo, bg=COLORS["background"])
-            logo_label.image = logo_photo
             logo_label.pack(side="left", padx=(0, 15))
-        except:
+        else:
             logo_frame = tk.Frame(header_frame, width=48, height=48, bg=COLORS["primary"])
             logo_frame.pack(side="left", padx=(0, 15))
 
@@ -178,12 +366,12 @@ class SRTTranslatorApp:
         
         tk.Label(
             title_frame, text="SRT Translator Pro", 
-            font=("Segoe UI", 22, "bold"), fg=COLORS["primary"], bg=COLORS["background"]
+            font="AppTitle", fg=COLORS["primary"], bg=COLORS["background"]
         ).pack(anchor="w")
         
         tk.Label(
             title_frame, text="Traduction et traitement vidéo avec IA", 
-            font=("Segoe UI", 12), fg=COLORS["text_secondary"], bg=COLORS["background"]
+            font="AppSub", fg=COLORS["text_secondary"], bg=COLORS["background"]
         ).pack(anchor="w")
 
     def _create_source_section(self, parent):
@@ -193,7 +381,7 @@ class SRTTranslatorApp:
         
         tk.Label(
             source_card, text="Source Vidéo", 
-            font=("Segoe UI", 14, "bold"), bg=COLORS["card_bg"]
+            font="AppSection", bg=COLORS["card_bg"]
         ).pack(anchor="w", pady=(0, 15))
         
         # URL d'entrée
@@ -224,7 +412,7 @@ class SRTTranslatorApp:
         
         tk.Label(
             config_card, text="Configuration", 
-            font=("Segoe UI", 14, "bold"), bg=COLORS["card_bg"]
+            font="AppSection", bg=COLORS["card_bg"]
         ).pack(anchor="w", pady=(0, 15))
         
         # Section des API Keys
@@ -232,19 +420,11 @@ class SRTTranslatorApp:
         api_frame.pack(fill="x", pady=(0, 15))
         
         tk.Label(
-            api_frame, text="Clés API", font=("Segoe UI", 12), 
+            api_frame, text="Clés API", font="AppSub", 
             bg=COLORS["card_bg"], fg=COLORS["primary"]
         ).pack(anchor="w", pady=(0, 5))
         
-        # DeepL API Key
-        tk.Label(api_frame, text="Clé API DeepL:", bg=COLORS["card_bg"], font=self.default_font).pack(anchor="w")
-        self.deepl_key_entry = tk.Entry(api_frame, font=self.default_font, bd=1, relief="solid", show="•")
-        self.deepl_key_entry.pack(fill="x", pady=(5, 10))
-        
-        # OpenAI API Key
-        tk.Label(api_frame, text="Clé API OpenAI:", bg=COLORS["card_bg"], font=self.default_font).pack(anchor="w")
-        self.openai_key_entry = tk.Entry(api_frame, font=self.default_font, bd=1, relief="solid", show="•")
-        self.openai_key_entry.pack(fill="x", pady=5)
+        self._build_fields(api_frame, API_KEY_FIELDS)
         
         # Gestion des langues
         language_frame = tk.Frame(config_card, bg=COLORS["card_bg"])
@@ -252,27 +432,11 @@ class SRTTranslatorApp:
         
         tk.Label(
             language_frame, text="Langue et Traduction", 
-            font=("Segoe UI", 12), bg=COLORS["card_bg"], fg=COLORS["primary"]
+            font="AppSub", bg=COLORS["card_bg"], fg=COLORS["primary"]
         ).pack(anchor="w", pady=(0, 5))
         
-        # Langue cible
-        tk.Label(language_frame, text="Langue cible:", bg=COLORS["card_bg"], font=self.default_font).pack(anchor="w")
-        self.language_combobox = ttk.Combobox(
-            language_frame, values=[
-                "FR - French", "EN - English", "ES - Spanish", "DE - German", "IT - Italian",
-                "ZH - Chinese", "JA - Japanese", "RU - Russian", "NL - Dutch",
-                "PT - Portuguese", "AR - Arabic", "HI - Hindi", "KO - Korean", "TR - Turkish"
-            ], state="readonly", font=self.default_font
-        )
-        self.language_combobox.pack(fill="x", pady=(5, 10))
-        
-        # Service de traduction
-        tk.Label(language_frame, text="Service de traduction:", bg=COLORS["card_bg"], font=self.default_font).pack(anchor="w")
-        self.service_combobox = ttk.Combobox(
-            language_frame, values=["ChatGPT", "DeepL"], 
-            state="readonly", font=self.default_font
-        )
-        self.service_combobox.pack(fill="x", pady=5)
+        # Langue cible et service de traduction
+        self._build_fields(language_frame, LANGUAGE_FIELDS)
 
     def _create_advanced_section(self, parent):
         """Crée la section des paramètres avancés."""
@@ -281,7 +445,7 @@ class SRTTranslatorApp:
         
         tk.Label(
             advanced_card, text="Paramètres Avancés", 
-            font=("Segoe UI", 14, "bold"), bg=COLORS["card_bg"]
+            font="AppSection", bg=COLORS["card_bg"]
         ).pack(anchor="w", pady=(0, 15))
         
         # Configuration Whisper
@@ -290,7 +454,7 @@ class SRTTranslatorApp:
         
         tk.Label(
             whisper_frame, text="Modèle Whisper", 
-            font=("Segoe UI", 12), bg=COLORS["card_bg"], fg=COLORS["primary"]
+            font="AppSub", bg=COLORS["card_bg"], fg=COLORS["primary"]
         ).pack(anchor="w", pady=(0, 5))
         
         # Option GPU
@@ -308,23 +472,11 @@ class SRTTranslatorApp:
         if not config.is_cuda_available():
             tk.Label(
                 gpu_frame, text="(CUDA non disponible)", 
-                fg=COLORS["error"], bg=COLORS["card_bg"], font=("Segoe UI", 9, "italic")
+                fg=COLORS["error"], bg=COLORS["card_bg"], font="AppNote"
             ).pack(side="left", padx=(5, 0))
         
         # Sélection du modèle
-        tk.Label(
-            whisper_frame, text="Sélectionnez le modèle Whisper:", 
-            bg=COLORS["card_bg"], font=self.default_font
-        ).pack(anchor="w")
-        
-        model_frame = tk.Frame(whisper_frame, bg=COLORS["card_bg"])
-        model_frame.pack(fill="x", pady=5)
-        
-        self.whisper_model_combobox = ttk.Combobox(
-            model_frame, values=["tiny", "base", "small", "medium", "large", "large-v3-turbo"], 
-            state="readonly", font=self.default_font
-        )
-        self.whisper_model_combobox.pack(side="left", fill="x", expand=True)
+        self._build_fields(whisper_frame, WHISPER_FIELDS)
         
         # Ressources modèles
         self.model_resources = {
@@ -335,22 +487,21 @@ class SRTTranslatorApp:
             "large": {"RAM": "16GB", "VRAM": "8GB"},
             "large-v3-turbo": {"RAM": "20GB", "VRAM": "10GB"}
         }
+        self.model_resource_text = {
+            model: f"Ressources estimées: RAM {info['RAM']} / VRAM {info['VRAM']}"
+            for model, info in self.model_resources.items()
+        }
         
         info_frame = tk.Frame(whisper_frame, bg=COLORS["card_bg"])
         info_frame.pack(fill="x", pady=(5, 0))
         
         self.resource_label = tk.Label(
             info_frame, text="", bg=COLORS["card_bg"], 
-            font=("Segoe UI", 9, "italic"), fg=COLORS["text_secondary"]
+            font="AppNote", fg=COLORS["text_secondary"]
         )
         self.resource_label.pack(anchor="w")
         
-        def update_resource_info(event):
-            model = self.whisper_model_combobox.get()
-            info = self.model_resources.get(model, {"RAM": "?", "VRAM": "?"})
-            self.resource_label.config(text=f"Ressources estimées: RAM {info['RAM']} / VRAM {info['VRAM']}")
-        
-        self.whisper_model_combobox.bind("<<ComboboxSelected>>", update_resource_info)
+        self.whisper_model_combobox.bind("<<ComboboxSelected>>", self._on_whisper_model_selected)
         
         # Options de performance
         perf_frame = tk.Frame(advanced_card, bg=COLORS["card_bg"])
@@ -358,7 +509,7 @@ class SRTTranslatorApp:
         
         tk.Label(
             perf_frame, text="Performance", 
-            font=("Segoe UI", 12), bg=COLORS["card_bg"], fg=COLORS["primary"]
+            font="AppSub", bg=COLORS["card_bg"], fg=COLORS["primary"]
         ).pack(anchor="w", pady=(0, 5))
         
         # Option multi-thread
@@ -375,7 +526,7 @@ class SRTTranslatorApp:
         
         tk.Label(
             status_card, text="État et Log", 
-            font=("Segoe UI", 14, "bold"), bg=COLORS["card_bg"]
+            font="AppSection", bg=COLORS["card_bg"]
         ).pack(anchor="w", pady=(0, 15))
         
         # Zone d'état du système
@@ -402,7 +553,7 @@ class SRTTranslatorApp:
         log_frame.pack(fill="both", expand=True, pady=(5, 0))
         
         self.log_text = tk.Text(
-            log_frame, font=("Consolas", 9), bg="#f8f9fa", 
+            log_frame, font="AppMono", bg="#f8f9fa", 
             height=10, wrap="word", state="disabled"
         )
         self.log_text.pack(fill="both", expand=True)
@@ -414,18 +565,48 @@ class SRTTranslatorApp:
         
         # Handler de logging pour l'interface
         class TextHandler(logging.Handler):
+            """Accumule les logs et les affiche par lots pour ne pas saturer la boucle Tk."""
+            FLUSH_INTERVAL = 80  # ms
+            
             def __init__(self, text_widget):
                 super().__init__()
                 self.text_widget = text_widget
+                self.buffer = deque()
+                self.buffer_lock = threading.Lock()
                 
             def emit(self, record):
                 msg = self.format(record)
-                def append():
+                with self.buffer_lock:
+                    was_empty = not self.buffer
+                    self.buffer.append(msg)
+                # Le minuteur n'est armé qu'au premier message d'un lot
+                if was_empty:
+                    try:
+                        self.text_widget.after(self.FLUSH_INTERVAL, self._flush)
+                    except (tk.TclError, RuntimeError):
+                        self._detach()
+            
+            def _flush(self):
+                with self.buffer_lock:
+                    messages = list(self.buffer)
+                    self.buffer.clear()
+                try:
                     self.text_widget.configure(state='normal')
-                    self.text_widget.insert('end', msg + '\n')
+                    self.text_widget.insert('end', '\n'.join(messages) + '\n')
+                    # Supprimer les lignes les plus anciennes au-delà de la limite
+                    end_line = int(self.text_widget.index('end-1c').split('.')[0])
+                    if end_line > MAX_LOG_LINES:
+                        self.text_widget.delete('1.0', f'{end_line - MAX_LOG_LINES}.0')
                     self.text_widget.see('end')
                     self.text_widget.configure(state='disabled')
-                self.text_widget.after(0, append)
+                except tk.TclError:
+                    self._detach()
+            
+            def _detach(self):
+                """Retire le handler quand le widget a été détruit."""
+                logging.getLogger().removeHandler(self)
+                with self.buffer_lock:
+                    self.buffer.clear()
         
         # Ajouter le handler personnalisé
         text_handler = TextHandler(self.log_text)
@@ -437,13 +618,15 @@ class SRTTranslatorApp:
         action_frame = tk.Frame(parent, bg=COLORS["background"])
         action_frame.pack(fill="x", pady=(20, 0))
         
-        process_btn = ModernButton(
+        # Désactivé tant que le processeur n'est pas chargé
+        self.process_btn = ModernButton(
             action_frame, text="Démarrer le Traitement", 
             command=lambda: self._process_video(),
-            font=("Segoe UI", 12, "bold"), padx=20, pady=12,
-            bg=COLORS["secondary"], hover_color="#ff5a92"
+            font="AppAction", padx=20, pady=12,
+            bg=COLORS["secondary"], hover_color="#ff5a92",
+            state="normal" if self.processor is not None else "disabled"
         )
-        process_btn.pack()
+        self.process_btn.pack()
 
     def _create_menu(self):
         """Crée le menu de l'application."""
@@ -489,40 +672,79 @@ class SRTTranslatorApp:
         if not self.whisper_model_combobox.get():
             self.whisper_model_combobox.set(config.whisper_model)
             # Mettre à jour l'info des ressources
-            model = self.whisper_model_combobox.get()
-            info = self.model_resources.get(model, {"RAM": "?", "VRAM": "?"})
-            self.resource_label.config(text=f"Ressources estimées: RAM {info['RAM']} / VRAM {info['VRAM']}")
+            self._update_resource_info()
+    
+    def _on_whisper_model_selected(self, event=None):
+        """Met à jour les ressources affichées et précharge le nouveau modèle."""
+        self._update_resource_info()
+        self._warmup_model()
+
+    def _update_resource_info(self):
+        """Affiche les ressources estimées pour le modèle Whisper sélectionné."""
+        self.resource_label.config(text=self.model_resource_text.get(
+            self.whisper_model_combobox.get(), "Ressources estimées: RAM ? / VRAM ?"
+        ))
     
     def _setup_command_listener(self):
         """Configure le listener de commandes venant du thread de traitement."""
-        def check_commands():
+        self._pending_commands = deque()
+        self._pending_lock = threading.Lock()
+        self.root.bind("<<Command>>", self._drain_commands)
+        
+        # Thread bloquant sur la queue : aucun réveil périodique de Tk
+        threading.Thread(target=self._pump_commands, daemon=True).start()
+    
+    def _pump_commands(self):
+        """Attend les commandes et signale la boucle Tk par un événement virtuel."""
+        while True:
+            cmd = command_queue.get()
+            with self._pending_lock:
+                self._pending_commands.append(cmd)
             try:
-                try:
-                    cmd = command_queue.get_nowait()
-                    self._handle_command(cmd)
-                except queue.Empty:
-                    pass
-                self.root.after(100, check_commands)
+                self.root.event_generate("<<Command>>", when="tail")
+            except (tk.TclError, RuntimeError):
+                # L'application a été fermée
+                break
+    
+    def _drain_commands(self, event=None):
+        """Traite toutes les commandes en attente dans le thread Tk."""
+        with self._pending_lock:
+            commands = list(self._pending_commands)
+            self._pending_commands.clear()
+        for cmd in commands:
+            try:
+                self._handle_command(cmd)
             except Exception as e:
                 logging.error(f"Erreur dans le listener de commandes: {e}")
-                self.root.after(1000, check_commands)
-        
-        # Démarrer la vérification des commandes
-        self.root.after(100, check_commands)
     
     def _handle_command(self, cmd):
         """Traite une commande provenant de la queue."""
         command = cmd.get("command")
         
-        if command == "processing_done":
+        if command == "cancel":
+            # La commande est consommée ici : la transmettre au processeur du traitement
+            if self._active_processor is not None:
+                self._active_processor.cancelled = True
+        elif command == "processing_done":
             self._handle_processing_done(cmd.get("video_folder"))
         elif command == "processing_cancelled":
             self._handle_processing_cancelled()
         elif command == "error":
             self._handle_processing_error(cmd.get("message"))
+        elif command == "processor_ready":
+            self._set_processor(cmd.get("processor"), cmd.get("threaded"))
+        elif command == "processor_error":
+            messagebox.showerror(
+                "Erreur d'initialisation",
+                f"Impossible de préparer le traitement :\n\n{cmd.get('message')}"
+            )
     
     def _process_video(self, video_path=None):
         """Démarre le traitement d'une vidéo."""
+        if self.processor is None:
+            messagebox.showinfo("Chargement en cours", "Le moteur de traitement est en cours de chargement, veuillez patienter.")
+            return
+        
         url = self.url_entry.get()
         deepl_key = self.deepl_key_entry.get()
         openai_key = self.openai_key_entry.get()
@@ -556,9 +778,11 @@ class SRTTranslatorApp:
             return
 
         # Créer la fenêtre de progression
+        from ui_components import ProgressWindow
         self.progress_window = ProgressWindow(self.root, "Traitement de la vidéo")
         
         # Démarrer le traitement
+        self._active_processor = self.processor
         if video_path:
             logging.info(f"Traitement d'un fichier vidéo local: {os.path.basename(video_path)}")
             self.processor.process_video(None, video_path, target_language, translation_service, use_gpu)
@@ -583,7 +807,9 @@ class SRTTranslatorApp:
     
     def _handle_processing_done(self, video_folder):
         """Gère la fin de traitement réussie."""
+        self._active_processor = None
         try:
+            from ui_components import ResultDialog
             self.progress_window.close()
             message = "Le traitement s'est terminé avec succès!\n\nTous les fichiers ont été enregistrés dans le dossier ci-dessous:"
             result_dialog = ResultDialog(self.root, "Traitement terminé", message, video_folder)
@@ -594,6 +820,10 @@ class SRTTranslatorApp:
     
     def _handle_processing_cancelled(self):
         """Gère l'annulation du traitement."""
+        # Ignorer une annulation signalée alors qu'aucun traitement n'est actif
+        if self._active_processor is None:
+            return
+        self._active_processor = None
         try:
             self.progress_window.close()
             messagebox.showinfo("Traitement annulé", "Le traitement a été annulé par l'utilisateur.", icon="info")
@@ -602,6 +832,7 @@ class SRTTranslatorApp:
     
     def _handle_processing_error(self, error_message):
         """Gère une erreur de traitement."""
+        self._active_processor = None
         try:
             self.progress_window.close()
             messagebox.showerror(
@@ -612,44 +843,49 @@ class SRTTranslatorApp:
         except Exception as e:
             logging.error(f"Erreur lors de l'affichage de l'erreur: {e}")
     
+    def _center_window(self, window, width, height):
+        """Dimensionne et centre une fenêtre sur l'écran."""
+        # La taille est connue : inutile de forcer un calcul de géométrie
+        x = (window.winfo_screenwidth() - width) // 2
+        y = (window.winfo_screenheight() - height) // 2
+        window.geometry(f"{width}x{height}+{x}+{y}")
+    
     def _show_about(self):
-        """Affiche la boîte de dialogue À propos avec style moderne."""
+        """Affiche la boîte de dialogue À propos (construite une seule fois)."""
+        if self._about_window is None:
+            self._about_window = self._build_about_window()
+        self._about_window.deiconify()
+        self._about_window.lift()
+    
+    def _build_about_window(self):
+        """Construit la boîte de dialogue À propos avec style moderne."""
         about_window = tk.Toplevel(self.root)
+        about_window.protocol("WM_DELETE_WINDOW", about_window.withdraw)
         about_window.title("À propos de SRT Translator Pro")
-        about_window.geometry("500x400")
         about_window.resizable(False, False)
         about_window.configure(bg=COLORS["card_bg"])
-        
-        # Centrer la fenêtre
-        about_window.update_idletasks()
-        width = about_window.winfo_width()
-        height = about_window.winfo_height()
-        x = (about_window.winfo_screenwidth() // 2) - (width // 2)
-        y = (about_window.winfo_screenheight() // 2) - (height // 2)
-        about_window.geometry('{}x{}+{}+{}'.format(width, height, x, y))
+        self._center_window(about_window, *ABOUT_WINDOW_SIZE)
         
         # Contenu avec padding
         content_frame = tk.Frame(about_window, bg=COLORS["card_bg"], padx=25, pady=25)
         content_frame.pack(fill="both", expand=True)
         
-        try:
-            logo_img = Image.open("assets/logo.png").resize((80, 80))
-            logo_photo = ImageTk.PhotoImage(logo_img)
+        logo_photo = _get_logo((80, 80))
+        if logo_photo:
             logo_label = tk.Label(content_frame, image=logo_photo, bg=COLORS["card_bg"])
-            logo_label.image = logo_photo
             logo_label.pack(pady=(0, 20))
-        except:
+        else:
             logo_frame = tk.Frame(content_frame, width=80, height=80, bg=COLORS["primary"])
             logo_frame.pack(pady=(0, 20))
         
         tk.Label(
             content_frame, text="SRT Translator Pro", 
-            font=("Segoe UI", 18, "bold"), bg=COLORS["card_bg"], fg=COLORS["primary"]
+            font="AppDialogTitle", bg=COLORS["card_bg"], fg=COLORS["primary"]
         ).pack()
         
         tk.Label(
             content_frame, text="Version 1.1", 
-            font=("Segoe UI", 10), bg=COLORS["card_bg"], fg=COLORS["text_secondary"]
+            font="AppBody", bg=COLORS["card_bg"], fg=COLORS["text_secondary"]
         ).pack(pady=(0, 20))
         
         description = """Une application avancée pour télécharger des vidéos, extraire l'audio, transcrire et traduire les sous-titres en utilisant la puissance de l'IA.
@@ -664,152 +900,129 @@ Fonctionnalités :
 Développée avec Python et tkinter."""
 
         text_box = tk.Text(
-            content_frame, font=("Segoe UI", 10), bg=COLORS["card_bg"],
+            content_frame, font="AppBody", bg=COLORS["card_bg"],
             relief="flat", height=10, wrap="word"
         )
-        text_box.insert("1.0", description)
-        text_box.config(state="disabled")
+        text_box.insert("end", description)
+        text_box.configure(state="disabled", cursor="")
         text_box.pack(fill="both", expand=True)
         
         ok_button = ModernButton(
-            content_frame, text="Fermer", command=about_window.destroy,
-            bg=COLORS["primary"], padx=20, pady=5, font=("Segoe UI", 10)
+            content_frame, text="Fermer", command=about_window.withdraw,
+            bg=COLORS["primary"], padx=20, pady=5, font="AppBody"
         )
         ok_button.pack(pady=(20, 0))
+        
+        return about_window
     
     def _show_help(self):
-        """Affiche l'aide de l'application avec style moderne."""
+        """Affiche l'aide de l'application (construite une seule fois)."""
+        if self._help_window is None:
+            self._help_window = self._build_help_window()
+        self._help_window.deiconify()
+        self._help_window.lift()
+    
+    def _prebuild_help_window(self):
+        """Construit la fenêtre d'aide, masquée, pour que la première ouverture soit immédiate."""
+        if self._help_window is None:
+            self._help_window = self._build_help_window()
+            self._help_window.withdraw()
+    
+    def _build_help_window(self):
+        """Construit la fenêtre d'aide de l'application avec style moderne."""
+        card_bg = COLORS["card_bg"]
+        primary = COLORS["primary"]
+        
         help_window = tk.Toplevel(self.root)
+        help_window.protocol("WM_DELETE_WINDOW", help_window.withdraw)
         help_window.title("Aide - SRT Translator Pro")
-        help_window.geometry("600x500")
-        help_window.configure(bg=COLORS["card_bg"])
-        
-        # Centrer la fenêtre
-        help_window.update_idletasks()
-        width = help_window.winfo_width()
-        height = help_window.winfo_height()
-        x = (help_window.winfo_screenwidth() // 2) - (width // 2)
-        y = (help_window.winfo_screenheight() // 2) - (height // 2)
-        help_window.geometry('{}x{}+{}+{}'.format(width, height, x, y))
-        
-        # Panneau principal
-        main_frame = tk.Frame(help_window, bg=COLORS["card_bg"], padx=25, pady=25)
-        main_frame.pack(fill="both", expand=True)
+        # Marges portées directement par la fenêtre (pas de Frame intermédiaire)
+        help_window.configure(bg=card_bg, padx=25, pady=25)
+        self._center_window(help_window, *HELP_WINDOW_SIZE)
         
         # En-tête
         tk.Label(
-            main_frame, text="Guide d'utilisation", 
-            font=("Segoe UI", 16, "bold"), bg=COLORS["card_bg"], fg=COLORS["primary"]
+            help_window, text="Guide d'utilisation", 
+            font="AppHeader", bg=card_bg, fg=primary
         ).pack(anchor="w", pady=(0, 20))
         
-        # Zone d'onglets
-        tab_control = ttk.Notebook(main_frame)
-        
-        # Contenus des onglets
-        tab_contents = {
-            "Démarrage rapide": """Comment utiliser SRT Translator Pro:
-
-1. Entrez une URL de vidéo dans le champ ou sélectionnez un fichier local avec le bouton "Parcourir".
-
-2. Configurez les clés API pour DeepL et/ou OpenAI selon le service de traduction que vous souhaitez utiliser.
-
-3. Sélectionnez la langue cible et le service de traduction.
-
-4. Ajustez les paramètres avancés si nécessaire (modèle Whisper, utilisation du GPU, etc.).
-
-5. Cliquez sur "Démarrer le traitement".
-
-6. Suivez la progression dans la fenêtre qui apparaît. Vous pouvez annuler à tout moment si nécessaire.""",
-            
-            "Paramètres avancés": """Paramètres avancés:
-
-• Modèles Whisper:
-  - tiny: Rapide, moins précis, idéal pour les tests (faibles ressources)
-  - base: Bon équilibre vitesse/précision pour les contenus simples
-  - small: Précision améliorée, adapté à la plupart des contenus
-  - medium: Haute précision, recommandé pour les contenus complexes
-  - large: Précision maximale, idéal pour les contenus difficiles
-  - large-v3-turbo: Dernière version, plus rapide et plus précise
-
-• Utilisation GPU:
-  L'option GPU accélère considérablement le traitement mais nécessite une carte NVIDIA compatible CUDA. La quantité de VRAM nécessaire dépend du modèle Whisper choisi.
-
-• Multi-threading:
-  Permet de traiter plusieurs tâches simultanément, ce qui accélère le processus global. Désactivez cette option si vous rencontrez des problèmes de stabilité ou de ressources.""",
-            
-            "Dépannage": """Résolution des problèmes courants:
-
-• Erreur d'API: 
-  Vérifiez que vos clés API sont correctes et que vous avez suffisamment de crédits.
-
-• Erreur de téléchargement:
-  Assurez-vous que l'URL est valide et accessible. Certaines plateformes peuvent restreindre les téléchargements.
-
-• Erreur de mémoire:
-  Essayez un modèle Whisper plus petit ou désactivez le multi-threading.
-
-• Erreur GPU:
-  Si vous rencontrez des problèmes avec le GPU, désactivez-le et utilisez le CPU.
-
-• Traduction incomplète:
-  Pour les vidéos longues, certains services peuvent limiter la taille des entrées. Essayez de diviser le traitement en sections plus petites.
-
-Pour plus d'aide, consultez les journaux d'application dans le menu "Journaux" > "Ouvrir le fichier journal"."""
-        }
+        # Bouton et liens placés en bas avant les onglets : ceux-ci
+        # n'occupent que la place restante et ne peuvent pas les masquer
+        close_button = ModernButton(
+            help_window, text="Fermer", command=help_window.withdraw,
+            bg=primary, font="AppBody", padx=20, pady=5
+        )
+        close_button.pack(side="bottom", pady=(5, 0))
         
-        # Créer les onglets
-        for tab_name, tab_content in tab_contents.items():
-            tab = ttk.Frame(tab_control)
-            tab_control.add(tab, text=tab_name)
-            
-            tab_frame = tk.Frame(tab, bg=COLORS["card_bg"], padx=15, pady=15)
-            tab_frame.pack(fill="both", expand=True)
-            
-            text_widget = tk.Text(
-                tab_frame, bg=COLORS["card_bg"], relief="flat",
-                wrap="word", font=("Segoe UI", 10), height=15
+        # Liens externes
+        links_frame = tk.Frame(help_window, bg=card_bg, pady=10)
+        links_frame.pack(side="bottom", fill="x")
+        for link_text, link_url in HELP_LINKS:
+            link = tk.Label(
+                links_frame, text=link_text, fg=primary, bg=card_bg,
+                cursor="hand2", font="AppLink"
             )
-            text_widget.insert("1.0", tab_content)
-            text_widget.config(state="disabled")
-            text_widget.pack(fill="both", expand=True)
+            link.pack(side="left", padx=(0, 15))
+            link.url = link_url
+            link.bind("<Button-1>", _open_link_event)
         
-        # Ajouter les onglets
-        tab_control.pack(fill="both", expand=True)
+        # Zone d'onglets
+        tab_control = ttk.Notebook(help_window)
         
-        # Liens externes
-        links_frame = tk.Frame(main_frame, bg=COLORS["card_bg"], pady=10)
-        links_frame.pack(fill="x")
+        # Créer les onglets vides : leur contenu est créé à la première sélection
+        self._pending_tabs = {}
+        for index, (tab_name, tab_content) in enumerate(HELP_TAB_CONTENTS):
+            tab = ttk.Frame(tab_control, padding=15, style="Card.TFrame")
+            tab_control.add(tab, text=tab_name)
+            self._pending_tabs[index] = (tab, tab_content)
+        tab_control.bind("<<NotebookTabChanged>>", self._materialize_tab)
         
-        def open_link(url):
-            webbrowser.open_new_tab(url)
+        # Remplir tout de suite l'onglet affiché
+        self._fill_help_tab(*self._pending_tabs.pop(0))
         
-        for link_text, link_url in [
-            ("Documentation en ligne", "https://huggingface.co/docs"),
-            ("API DeepL", "https://www.deepl.com/docs-api")
-        ]:
-            link = tk.Label(
-                links_frame, text=link_text, fg=COLORS["primary"], bg=COLORS["card_bg"],
-                cursor="hand2", font=("Segoe UI", 9, "underline")
-            )
-            link.pack(side="left", padx=(0, 15))
-            link.bind("<Button-1>", lambda e, url=link_url: open_link(url))
+        # Ajouter les onglets
+        tab_control.pack(fill="both", expand=True)
         
-        # Bouton fermer
-        close_button = ModernButton(
-            main_frame, text="Fermer", command=help_window.destroy,
-            bg=COLORS["primary"], font=("Segoe UI", 10), padx=20, pady=5
+        return help_window
+    
+    def _materialize_tab(self, event):
+        """Crée le contenu d'un onglet d'aide lors de sa première sélection."""
+        pending = self._pending_tabs.pop(event.widget.index("current"), None)
+        if pending:
+            self._fill_help_tab(*pending)
+    
+    def _fill_help_tab(self, tab, tab_content):
+        """Crée le texte d'un onglet d'aide."""
+        # Texte statique : un Label suffit, sans l'arbre ni les tags d'un widget Text.
+        # Il est placé dans un Canvas pour défiler dans la hauteur laissée par les onglets.
+        canvas = tk.Canvas(tab, bg=COLORS["card_bg"], highlightthickness=0)
+        scrollbar = ttk.Scrollbar(tab, orient="vertical", command=canvas.yview)
+        canvas.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side="right", fill="y")
+        canvas.pack(side="left", fill="both", expand=True)
+        
+        label = ttk.Label(
+            canvas, text=tab_content, justify="left",
+            font="AppBody", background=COLORS["card_bg"]
         )
-        close_button.pack(pady=(15, 0))
+        canvas.create_window(0, 0, window=label, anchor="nw")
+        
+        # Retour à la ligne sur la largeur visible, zone de défilement sur la hauteur du texte
+        canvas.bind("<Configure>", lambda e: label.configure(wraplength=e.width))
+        label.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
+        for widget in (canvas, label):
+            widget.bind("<MouseWheel>", lambda e: canvas.yview_scroll(-e.delta // 120, "units"))
     
-    def run(self):
-        """Lance l'application."""
-        # Journaliser le démarrage de l'application
+    def _log_startup_env(self):
+        """Journalise le démarrage et l'environnement GPU."""
         logging.info("=== Application SRT Translator Pro démarrée (avec support multi-thread) ===")
         if config.is_cuda_available():
             logging.info(f"GPU détecté: {config.get_gpu_name()}")
         else:
             logging.info("Aucun GPU compatible CUDA détecté, utilisation du CPU uniquement")
-        
+    
+    def run(self):
+        """Lance l'application."""
         # Démarrer la boucle principale
         self.root.mainloop()
 
@@ -818,13 +1031,18 @@ def main():
     # Configuration des logs
     setup_logger()
     
+    # Journaliser les exceptions non interceptées, y compris celles des threads
+    sys.excepthook = _excepthook
+    threading.excepthook = _thread_excepthook
+    
     try:
-        # Créer et démarrer l'application
+        # Créer l'application (les étapes différées sont protégées par _next_step)
         app = SRTTranslatorApp()
-        app.run()
     except Exception as e:
-        logging.critical(f"Erreur critique: {str(e)}", exc_info=True)
-        messagebox.showerror("Erreur critique", f"Une erreur inattendue s'est produite: {str(e)}")
+        _report_fatal_error(e)
+        return
+    
+    app.run()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -3,6 +3,8 @@ import json
 import csv
 import torch
 import logging
+import threading
+from contextlib import contextmanager
 from typing import Dict, Optional
 
 # === Patch robust pour hook_attention_weights ===
@@ -35,11 +37,101 @@ import whisper_timestamped as whisper
 from utils import progress_queue, config
 
 # Afficher les logs Whisper pour voir le verbose
-logging.basicConfig(level=logging.INFO)
 logging.getLogger("huggingface_hub").setLevel(logging.ERROR)
 logging.getLogger("whisper_timestamped").setLevel(logging.INFO)
 
 
+# Instance libre du modèle Whisper, gardée sur CPU entre deux transcriptions pour
+# laisser la VRAM à Demucs. Une instance occupée n'est jamais partagée : deux
+# transcriptions simultanées (mode multi-thread) utilisent deux instances.
+_idle_models: Dict = {}
+_preloading: Dict = {}
+_returning = set()
+_model_lock = threading.Lock()
+_evict_timer = None
+
+# Délai (secondes) après lequel l'instance libre inutilisée est libérée de la RAM
+IDLE_MODEL_TIMEOUT = 10 * 60
+
+
+def _get_device() -> str:
+    return "cuda" if config.is_cuda_available() else "cpu"
+
+
+def _evict_idle_models() -> None:
+    """Libère l'instance libre restée inutilisée."""
+    with _model_lock:
+        if _idle_models:
+            logging.info("Modèle Whisper inutilisé libéré de la mémoire")
+            _idle_models.clear()
+
+
+def _store_idle_model(name: str, model) -> None:
+    """Met une instance en réserve (à appeler sous _model_lock)."""
+    global _evict_timer
+    _idle_models.clear()
+    _idle_models[name] = model
+    if _evict_timer is not None:
+        _evict_timer.cancel()
+    _evict_timer = threading.Timer(IDLE_MODEL_TIMEOUT, _evict_idle_models)
+    _evict_timer.daemon = True
+    _evict_timer.start()
+
+
+def load_whisper_model(model_name: Optional[str] = None) -> None:
+    """Précharge une instance libre du modèle Whisper (sur CPU) si aucune n'est disponible."""
+    name = model_name or config.whisper_model
+    with _model_lock:
+        if name in _idle_models or name in _preloading:
+            return
+        done = _preloading[name] = threading.Event()
+    try:
+        logging.info(f"Préchargement du modèle {name}")
+        model = whisper.load_model(name, device="cpu")
+        with _model_lock:
+            _store_idle_model(name, model)
+    finally:
+        with _model_lock:
+            del _preloading[name]
+        done.set()
+
+
+@contextmanager
+def _borrow_model(model_name: Optional[str], device: str):
+    """Fournit l'instance libre du modèle, ou en charge une nouvelle si elle est occupée."""
+    name = model_name or config.whisper_model
+    with _model_lock:
+        model = _idle_models.pop(name, None)
+        preloading = _preloading.get(name)
+    if model is None and preloading is not None:
+        # Préchargement en cours : l'attendre plutôt que charger le modèle deux fois
+        preloading.wait()
+        with _model_lock:
+            model = _idle_models.pop(name, None)
+    if model is None:
+        logging.info(f"Chargement du modèle {name} sur {device}")
+        model = whisper.load_model(name, device=device)
+    else:
+        model.to(device)
+    try:
+        yield model
+    finally:
+        # Décider sous verrou : une instance déjà en réserve (ou en retour)
+        # rend celle-ci inutile, elle est abandonnée sans copie vers le CPU
+        with _model_lock:
+            keep = name not in _idle_models and name not in _returning
+            if keep:
+                _returning.add(name)
+        if keep:
+            model.to("cpu")
+            with _model_lock:
+                _returning.discard(name)
+                _store_idle_model(name, model)
+        del model
+        if device == "cuda":
+            torch.cuda.empty_cache()
+
+
 def _fmt_time(sec: float) -> str:
     ms = int((sec - int(sec)) * 1000)
     total = int(sec)
@@ -115,24 +207,22 @@ def run_transcription(
     params = {k: v for k, v in defaults.items() if v is not None}
     params.update(kwargs)
 
-    device = "cuda" if torch.cuda.is_available() else "cpu"
-    model_to_load = model_name or config.whisper_model
-    logging.info(f"Chargement du modèle {model_to_load} sur {device}")
+    device = _get_device()
     progress_queue.put({"value": 20, "status_text": f"Transcription sur {device}..."})
-    model = whisper.load_model(model_to_load, device=device)
 
-    try:
-        result = whisper.transcribe(model, audio_path, **params)
-    except AssertionError as ae:
-        logging.warning("Timestamped failed (%s), fallback transcription.", ae)
-        basic = model.transcribe(
-            audio_path,
-            language=language,
-            beam_size=params.get("beam_size"),
-            best_of=params.get("best_of"),
-            temperature=params.get("temperature")
-        )
-        result = {"language": basic["language"], "segments": basic["segments"]}
+    with _borrow_model(model_name, device) as model:
+        try:
+            result = whisper.transcribe(model, audio_path, **params)
+        except AssertionError as ae:
+            logging.warning("Timestamped failed (%s), fallback transcription.", ae)
+            basic = model.transcribe(
+                audio_path,
+                language=language,
+                beam_size=params.get("beam_size"),
+                best_of=params.get("best_of"),
+                temperature=params.get("temperature")
+            )
+            result = {"language": basic["language"], "segments": basic["segments"]}
 
     _write_all_outputs(result, base_name)
     return result
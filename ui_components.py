@@ -12,7 +12,7 @@ import logging
 import threading
 import queue
 
-from utils import log_queue, progress_queue, command_queue, open_folder
+from utils import log_queue, progress_queue, command_queue, open_folder, MAX_LOG_LINES
 
 class ProgressWindow:
     """Fenêtre affichant la progression du traitement avec logs."""
@@ -201,6 +201,7 @@ class ProgressWindow:
         try:
             self.log_text.configure(state="normal")
             self.log_text.insert(tk.END, msg + "\n", level_tag)
+            self._trim_log()
             self.log_text.see(tk.END)  # Défiler automatiquement vers le bas
             self.log_text.configure(state="disabled")
         except Exception as e:
@@ -211,11 +212,18 @@ class ProgressWindow:
         try:
             self.log_text.configure(state="normal")
             self.log_text.insert(tk.END, msg + "\n", "ERROR")
+            self._trim_log()
             self.log_text.see(tk.END)
             self.log_text.configure(state="disabled")
         except:
             pass
     
+    def _trim_log(self):
+        """Supprime les lignes les plus anciennes au-delà de MAX_LOG_LINES."""
+        end_line = int(self.log_text.index("end-1c").split(".")[0])
+        if end_line > MAX_LOG_LINES:
+            self.log_text.delete("1.0", f"{end_line - MAX_LOG_LINES}.0")
+    
     def _process_progress_queue(self):
         """Traite les mises à jour de progression dans la queue."""
         while self.running:
@@ -8,12 +8,14 @@ Module pour les fonctions utilitaires, la configuration et le logging.
 import os
 import json
 import logging
+import logging.handlers
 import queue
+import atexit
 import io
 import sys
 import platform
 import subprocess
-import torch
+import functools
 
 # Queues pour la communication entre les threads
 log_queue = queue.Queue()
@@ -24,6 +26,20 @@ command_queue = queue.Queue()
 KEYS_FILE = "api_keys.json"
 CONFIG_FILE = "config.json"
 
+# Nombre maximal de lignes conservées dans les zones de logs de l'interface
+MAX_LOG_LINES = 2000
+
+# Niveaux minimaux des bibliothèques trop bavardes (les sous-loggers en héritent)
+NOISY_LOGGER_LEVELS = {
+    "huggingface_hub": logging.ERROR,
+    "transformers": logging.WARNING,
+    "numba": logging.WARNING,
+    "httpx": logging.WARNING,
+    "openai": logging.WARNING,
+    "urllib3": logging.WARNING,
+    "requests": logging.WARNING,
+}
+
 class LockMessageFilter(logging.Filter):
     """Filtre qui bloque les messages liés aux verrous."""
     def filter(self, record):
@@ -63,6 +79,20 @@ class QueueHandler(logging.Handler):
     def emit(self, record):
         self.log_queue.put(record)
 
+@functools.lru_cache(maxsize=1)
+def _cuda_available():
+    """Détecte CUDA une seule fois (l'initialisation du pilote est coûteuse)."""
+    # torch n'est importé qu'ici : il reste hors du démarrage de l'interface
+    import torch
+    return torch.cuda.is_available()
+
+@functools.lru_cache(maxsize=1)
+def _gpu_name():
+    if not _cuda_available():
+        return "Aucun GPU détecté"
+    import torch
+    return torch.cuda.get_device_name(0)
+
 # Variables de redirection stdout/stderr
 original_stdout = None
 original_stderr = None
@@ -74,14 +104,10 @@ def setup_logger():
     if not os.path.exists('logs'):
         os.makedirs('logs')
 
-    # Désactiver complètement les logs de verrou huggingface
-    logging.getLogger("huggingface_hub").setLevel(logging.ERROR)
-    logging.getLogger("httpx").setLevel(logging.WARNING)
-    logging.getLogger("openai").setLevel(logging.WARNING)
-    logging.getLogger("urllib3").setLevel(logging.WARNING)
-    logging.getLogger("requests").setLevel(logging.WARNING)
-    logging.getLogger("huggingface_hub.file_download").setLevel(logging.ERROR)
-    logging.getLogger("huggingface_hub.utils").setLevel(logging.ERROR)
+    # Désactiver les logs des bibliothèques bavardes (dont les verrous huggingface).
+    # Le niveau rejette les messages avant même la création de l'enregistrement.
+    for logger_name, level in NOISY_LOGGER_LEVELS.items():
+        logging.getLogger(logger_name).setLevel(level)
 
     log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
 
@@ -103,11 +129,19 @@ def setup_logger():
     file_handler.addFilter(lock_filter)
     console_handler.addFilter(lock_filter)
 
+    # Les écritures fichier/console sont faites par un thread d'arrière-plan :
+    # les threads appelants (dont l'interface) ne font qu'un put dans une queue
+    io_queue = queue.Queue(-1)
+    io_listener = logging.handlers.QueueListener(
+        io_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    io_listener.start()
+    atexit.register(io_listener.stop)
+
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.DEBUG)
     root_logger.addHandler(queue_handler)
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+    root_logger.addHandler(logging.handlers.QueueHandler(io_queue))
 
     original_stdout = sys.stdout
     original_stderr = sys.stderr
@@ -130,7 +164,8 @@ class Config:
         self.openai_key = ""
         self.default_language = "FR - French"
         self.default_service = "ChatGPT"
-        self.use_gpu = torch.cuda.is_available()
+        # Valeur par défaut détectée au premier accès (voir use_gpu)
+        self._use_gpu = None
         self.output_folder = "output"
         self.whisper_model = "large-v3-turbo"
         self.use_threading = True
@@ -168,7 +203,7 @@ class Config:
                     config = json.load(file)
                     self.default_language = config.get("default_language", self.default_language)
                     self.default_service = config.get("default_service", self.default_service)
-                    self.use_gpu = config.get("use_gpu", self.use_gpu)
+                    self._use_gpu = config.get("use_gpu", self._use_gpu)
                     self.output_folder = config.get("output_folder", self.output_folder)
                     self.whisper_model = config.get("whisper_model", self.whisper_model)
                     self.use_threading = config.get("use_threading", self.use_threading)
@@ -195,13 +230,30 @@ class Config:
             logging.error(f"Erreur lors de la sauvegarde de la configuration: {str(e)}")
             return False
 
+    @property
+    def use_gpu(self):
+        # Détection CUDA différée : elle ne doit pas avoir lieu à l'import du module
+        if self._use_gpu is None:
+            self._use_gpu = _cuda_available()
+        return self._use_gpu
+
+    @use_gpu.setter
+    def use_gpu(self, value):
+        self._use_gpu = value
+
     @staticmethod
     def is_cuda_available():
-        return torch.cuda.is_available()
+        return _cuda_available()
 
     @staticmethod
     def get_gpu_name():
-        return torch.cuda.get_device_name(0) if torch.cuda.is_available() else "Aucun GPU détecté"
+        return _gpu_name()
+
+    @staticmethod
+    def invalidate_gpu_cache():
+        """Force une nouvelle détection du GPU (changement de périphérique)."""
+        _cuda_available.cache_clear()
+        _gpu_name.cache_clear()
 
 def open_folder(path):
     logging.info(f"Tentative d'ouverture du dossier: {path}")
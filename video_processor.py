@@ -12,12 +12,11 @@ import threading
 import concurrent.futures
 from openai import OpenAI
 import time
-import queue
 
 from utils import progress_queue, command_queue, restore_std_redirects, enable_std_redirects
 from video_downloader import download_video, sanitize_filename, ensure_unique_path
 from audio_extractor import extract_audio, separate_audio
-from transcriber import transcribe_audio
+from transcriber import transcribe_audio, load_whisper_model
 from translate import translate_srt_file, set_api_keys
 from utils import progress_queue, command_queue, restore_std_redirects, enable_std_redirects, format_whisper_model_name
 
@@ -33,6 +32,7 @@ class VideoProcessor:
         """
         self.config = config
         self.cancelled = False
+        self.cancel_reported = False
         self.client = None
         self.update_api_client()
     
@@ -42,6 +42,18 @@ class VideoProcessor:
         # Mettre à jour aussi dans le module translate
         set_api_keys(self.config.deepl_key, self.config.openai_key)
     
+    def warmup(self, model_name=None):
+        """
+        Précharge le modèle Whisper pour que le premier traitement ne l'attende pas.
+        
+        Args:
+            model_name: Nom du modèle Whisper (par défaut celui de la configuration)
+        """
+        try:
+            load_whisper_model(format_whisper_model_name(model_name or self.config.whisper_model))
+        except Exception as e:
+            logging.warning(f"Préchargement du modèle Whisper impossible: {e}")
+    
     def process_video(self, url=None, video_path=None, target_language=None, translation_service=None, use_gpu=None):
         """
         Traite une vidéo à partir d'une URL ou d'un fichier local.
@@ -71,6 +83,10 @@ class VideoProcessor:
         if use_gpu is None:
             use_gpu = self.config.use_gpu
         
+        # Nouveau traitement : réinitialiser l'état d'annulation
+        self.cancelled = False
+        self.cancel_reported = False
+        
         # Démarrer le processus dans un thread séparé
         processing_thread = threading.Thread(
             target=self._process_video_thread,
@@ -290,24 +306,14 @@ class VideoProcessor:
     
     def _check_cancelled(self):
         """Vérifie si l'utilisateur a annulé le traitement."""
-        try:
-            # Vérifier s'il y a une commande d'annulation dans la queue
-            cmd = command_queue.get_nowait()
-            if cmd.get("command") == "cancel":
+        # La commande "cancel" est lue par l'interface, seule consommatrice de
+        # command_queue, qui positionne ce flag sur le processeur du traitement
+        if self.cancelled:
+            # Signaler l'annulation à l'interface une seule fois par traitement
+            if not self.cancel_reported:
+                self.cancel_reported = True
                 logging.info("Traitement annulé par l'utilisateur")
                 command_queue.put({"command": "processing_cancelled"})
-                return True
-            else:
-                # Remettre la commande dans la queue si ce n'est pas une annulation
-                command_queue.put(cmd)
-        except queue.Empty:
-            # Pas de commande dans la queue
-            pass
-            
-        # Vérifier également le flag interne
-        if self.cancelled:
-            logging.info("Traitement annulé (flag interne)")
-            command_queue.put({"command": "processing_cancelled"})
             return True
             
         return False
@@ -325,6 +331,7 @@ class ThreadedVideoProcessor:
         """
         self.config = config
         self.cancelled = False
+        self.cancel_reported = False
         self.client = None
         self.update_api_client()
         
@@ -343,6 +350,18 @@ class ThreadedVideoProcessor:
         # Mettre à jour aussi dans le module translate
         set_api_keys(self.config.deepl_key, self.config.openai_key)
     
+    def warmup(self, model_name=None):
+        """
+        Précharge le modèle Whisper pour que le premier traitement ne l'attende pas.
+        
+        Args:
+            model_name: Nom du modèle Whisper (par défaut celui de la configuration)
+        """
+        try:
+            load_whisper_model(format_whisper_model_name(model_name or self.config.whisper_model))
+        except Exception as e:
+            logging.warning(f"Préchargement du modèle Whisper impossible: {e}")
+    
     def process_video(self, url=None, video_path=None, target_language=None, translation_service=None, use_gpu=None):
         """
         Traite une vidéo à partir d'une URL ou d'un fichier local.
@@ -372,6 +391,10 @@ class ThreadedVideoProcessor:
         if use_gpu is None:
             use_gpu = self.config.use_gpu
         
+        # Nouveau traitement : réinitialiser l'état d'annulation
+        self.cancelled = False
+        self.cancel_reported = False
+        
         # Démarrer le processus dans un thread séparé
         processing_thread = threading.Thread(
             target=self._process_video_thread,
@@ -389,24 +412,14 @@ class ThreadedVideoProcessor:
     
     def _check_cancelled(self):
         """Vérifie si l'utilisateur a annulé le traitement."""
-        try:
-            # Vérifier s'il y a une commande d'annulation dans la queue
-            cmd = command_queue.get_nowait()
-            if cmd.get("command") == "cancel":
+        # La commande "cancel" est lue par l'interface, seule consommatrice de
+        # command_queue, qui positionne ce flag sur le processeur du traitement
+        if self.cancelled:
+            # Signaler l'annulation à l'interface une seule fois par traitement
+            if not self.cancel_reported:
+                self.cancel_reported = True
                 logging.info("Traitement annulé par l'utilisateur")
                 command_queue.put({"command": "processing_cancelled"})
-                return True
-            else:
-                # Remettre la commande dans la queue si ce n'est pas une annulation
-                command_queue.put(cmd)
-        except queue.Empty:
-            # Pas de commande dans la queue
-            pass
-            
-        # Vérifier également le flag interne
-        if self.cancelled:
-            logging.info("Traitement annulé (flag interne)")
-            command_queue.put({"command": "processing_cancelled"})
             return True
             
         return False